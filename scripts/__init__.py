@@ -1,18 +1,23 @@
-from pathlib import Path
-from sys import path as sys_path
 from logging import getLogger, basicConfig, INFO, Logger
 
-PROJECT_ROOT: str = str(Path.cwd())
-if PROJECT_ROOT not in sys_path:
-    sys_path.insert(0, PROJECT_ROOT)
-
-basicConfig(
-    level=INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s:\n * %(message)s\n",
-    datefmt="%H:%M:%S",
-)
+from py_clean_cli.helpers import PROJECT_ROOT
 
 # 💡 NOTE: Using logger instance (not direct imports) for better namespace control in library code
 LOGGER: Logger = getLogger(__name__)
 
-__all__ = ["LOGGER", "PROJECT_ROOT"]
+
+def configure_logging() -> None:
+    """
+    Install the root handler and format used by the scripts CLI.
+
+    Called by the entry points instead of at import time, so importing a command
+    module does not configure logging as a side effect. Repeated calls are no-ops.
+    """
+    basicConfig(
+        level=INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s:\n * %(message)s\n",
+        datefmt="%H:%M:%S",
+    )
+
+
+__all__ = ["LOGGER", "PROJECT_ROOT", "configure_logging"]
@@ -1,3 +1,6 @@
 from py_clean_cli import package_cli
 
+from scripts import configure_logging
+
+configure_logging()
 package_cli()
@@ -9,8 +9,7 @@ Sets up a standardized .gitignore in .config folder:
 from pathlib import Path
 from dataclasses import dataclass, field
 from subprocess import run as subprocess_run
-from typing import Iterator, Any, Optional, Self
-from textwrap import dedent
+from typing import Dict, Iterable, Iterator, Any, Optional, Self, ClassVar, List, Tuple
 
 from simple_parsing import field
 
@@ -18,44 +17,78 @@ from py_clean_cli import command, CommandArgsModel
 from scripts import LOGGER, PROJECT_ROOT
 
 
-GITIGNORE_TEMPLATE = dedent(
-    """
-    # environment variables
-    .env
-    env
-    .configs/.env
-
-    # .vscode settings
-    .vscode/settings.json
-
-    # IA settings
-    .claude/settings.local.json
-
-    # ChromaDB local database and files
-    .configs/memorys_ia_db/
-
-    # Byte-compiled / optimized / DLL files
-    __pycache__/
-    *.py[cod]
-    *.pyd
-
-    # Distribution / packaging
-    env/
-    build/
-    dist/
-
-    # Installer logs
-    logs/
-    develop-eggs/
-    .eggs/
-    *.egg-info/
-    .installed.cfg
-    *.egg
-
-    # Mock files
-    docs/.mocks/
+# 💡 NOTE: Written at column 0 so no `dedent()` pass is needed at import time
+GITIGNORE_TEMPLATE = """
+# environment variables
+.env
+env
+.configs/.env
+
+# .vscode settings
+.vscode/settings.json
+
+# IA settings
+.claude/settings.local.json
+
+# ChromaDB local database and files
+.configs/memorys_ia_db/
+
+# Byte-compiled / optimized / DLL files
+__pycache__/
+*.py[cod]
+*.pyd
+
+# Distribution / packaging
+env/
+build/
+dist/
+
+# Installer logs
+logs/
+develop-eggs/
+.eggs/
+*.egg-info/
+.installed.cfg
+*.egg
+
+# Mock files
+docs/.mocks/
 """
-)
+GITIGNORE_TEMPLATE_BYTES = GITIGNORE_TEMPLATE.encode()
+
+
+def _read_git_config(text: str) -> Dict[str, str]:
+    """
+    Read the plain `section.key` entries of a git config file.
+
+    Only what `update_git_config` needs is understood: entries under subsection
+    headers (`[remote "origin"]`) are skipped, and values are unquoted but not
+    otherwise interpreted.
+
+    Args:
+        text (str): Contents of the git config file.
+
+    Returns:
+        Dict[str, str]: Lower-cased `section.key` names mapped to their unquoted value.
+    """
+    entries: Dict[str, str] = {}
+    section = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line[0] == "[":
+            header = line[1:line.find("]")].strip()
+            section = None if " " in header or "\"" in header else header.lower()
+            continue
+        if section is None:
+            continue
+        key, _, value = line.partition("=")
+        value = value.strip()
+        if len(value) > 1 and value[0] == value[-1] == '"':
+            value = value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+        entries[f"{section}.{key.strip().lower()}"] = value
+    return entries
 
 
 @dataclass
@@ -63,6 +96,14 @@ class GitignoreSetup:
     """
     Class to setup .gitignore in .configs directory
     """
+    # 💡 NOTE: Explicit execution order of the setup steps (no reflection over `dir()`)
+    _STEPS: ClassVar[Tuple[str, ...]] = (
+        "remove_old_gitignore",
+        "create_config_dir",
+        "create_or_update_gitignore",
+        "update_git_config",
+    )
+
     config_dir: str = field(default=".configs", init=True)
     old_gitignore: str = field(default=".gitignore", init=True)
     _new_gitignore: str = field(init=False)
@@ -71,52 +112,144 @@ class GitignoreSetup:
         self._old_gitignore_path = Path(PROJECT_ROOT) / self.old_gitignore
         self._config_dir_path = Path(PROJECT_ROOT) / self.config_dir
         self._new_gitignore_path = self._config_dir_path / ".gitignore"
+        # 💡 NOTE: Probed once here and kept current by the steps that change them
+        self._old_exists = self._old_gitignore_path.exists()
+        self._config_exists = self._config_dir_path.exists()
 
     def remove_old_gitignore(self):
-        if self._old_gitignore_path.exists():
+        if self._old_exists:
             LOGGER.debug(f"Removing existing {self.old_gitignore} file")
-            self._old_gitignore_path.unlink()
+            self._old_gitignore_path.unlink(missing_ok=True)
+            self._old_exists = False
             return f"Removed {self.old_gitignore}"
         return f"{self.old_gitignore} not found, skipping removal"
 
     def create_config_dir(self):
-        if not self._config_dir_path.exists():
+        if not self._config_exists:
             LOGGER.debug(f"Creating directory {self._config_dir_path}")
             self._config_dir_path.mkdir(exist_ok=True)
+            self._config_exists = True
             return f"Created directory {self._config_dir_path}"
         return f"Directory {self._config_dir_path} already exists"
 
     def create_or_update_gitignore(self) -> str:
-        if self._new_gitignore_path.exists():
+        # 💡 NOTE: Exclusive create ("x" mode, O_CREAT | O_EXCL) replaces the exists() probe
+        try:
+            with self._new_gitignore_path.open("xb") as gitignore_file:
+                LOGGER.debug(f"Creating new {self._new_gitignore_path}")
+                gitignore_file.write(GITIGNORE_TEMPLATE_BYTES)
+        except FileExistsError:
             LOGGER.debug(f"Using existing {self._new_gitignore_path}")
             return f"Using existing {self._new_gitignore_path}"
-        else:
-            LOGGER.debug(f"Creating new {self._new_gitignore_path}")
-            with open(self._new_gitignore_path, "w") as f:
-                f.write(GITIGNORE_TEMPLATE)
-            return f"Created new {self._new_gitignore_path}"
-
-    def update_git_config(self) -> str:
-        LOGGER.debug(f"Updating git configuration to use {self._new_gitignore_path}")
-        subprocess_run(["git", "config", "core.excludesFile", str(self._new_gitignore_path)], check=True)
+        return f"Created new {self._new_gitignore_path}"
+
+    def git_settings(self) -> Tuple[Tuple[str, str], ...]:
+        """
+        Git configuration entries written by `update_git_config`.
+
+        Returns:
+            Tuple[Tuple[str, str], ...]: The (key, value) pairs to set.
+        """
+        return (("core.excludesFile", str(self._new_gitignore_path)),)
+
+    def update_git_config(self, settings: Optional[Iterable[Tuple[str, str]]] = None) -> str:
+        """
+        Write git configuration entries for the repository.
+
+        Args:
+            settings (Optional[Iterable[Tuple[str, str]]]): The (key, value) pairs to set.
+                Defaults to `git_settings()`, so new setup entries are appended there
+                instead of adding new `git config` steps.
+
+        Returns:
+            str: A summary of the configuration change.
+        """
+        if settings is None:
+            settings = self.git_settings()
+        settings = tuple(settings)
+
+        if not self._write_git_config_file(settings):
+            for key, value in settings:
+                LOGGER.debug(f"Setting git config {key} = {value}")
+                subprocess_run(["git", "config", key, value], check=True)
         return f"Git is now configured to use {self._new_gitignore_path}"
 
+    def _write_git_config_file(self, settings: Tuple[Tuple[str, str], ...]) -> bool:
+        """
+        Append new git configuration entries to `.git/config` without running git.
+
+        Handles the common case of a plain repository where none of the keys is set
+        yet (or all are already set to the wanted value). Anything else, such as a
+        worktree, an existing different value, or a held lock, is left to `git config`.
+
+        Args:
+            settings (Tuple[Tuple[str, str], ...]): The (key, value) pairs to set.
+
+        Returns:
+            bool: True if the configuration is up to date, False if git must be run.
+        """
+        git_dir = Path(PROJECT_ROOT) / ".git"
+        config_path = git_dir / "config"
+        # 💡 NOTE: A `.git` file (worktree, submodule) points elsewhere; let git resolve it
+        if not git_dir.is_dir():
+            return False
+        try:
+            text = config_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return False
+
+        existing = _read_git_config(text)
+        lines = []
+        for key, value in settings:
+            section, dot, name = key.partition(".")
+            if not dot or "." in name or "\n" in value:
+                return False
+            current = existing.get(key.lower())
+            if current == value:
+                continue
+            if current is not None:
+                return False
+            escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'[{section}]\n\t{name} = "{escaped}"\n')
+        if not lines:
+            LOGGER.debug("Git config already up to date")
+            return True
+
+        if text and not text.endswith("\n"):
+            text += "\n"
+        # 💡 NOTE: Same protocol as git itself: exclusive `config.lock`, then an atomic rename
+        lock_path = git_dir / "config.lock"
+        try:
+            lock_file = lock_path.open("x", encoding="utf-8")
+        except OSError:
+            # Held by another git process (or not creatable): not ours to remove
+            return False
+        try:
+            with lock_file:
+                lock_file.write(text + "".join(lines))
+            lock_path.replace(config_path)
+        except (OSError, UnicodeError):
+            # 💡 NOTE: A leftover lock would make `git config` (the fallback) and every later write fail
+            lock_path.unlink(missing_ok=True)
+            return False
+        LOGGER.debug(f"Wrote {len(lines)} entries to {config_path}")
+        return True
+
     def setup_all(self):
-        self.remove_old_gitignore()
-        self.create_config_dir()
-        self.create_or_update_gitignore()
-        self.update_git_config()
+        for step_name in self._STEPS:
+            getattr(self, step_name)()
 
     @classmethod
     def auto_execute_all_methods(cls, instance: Optional[Self] = None) -> Iterator[Any]:
         """
-        Class method that automatically executes all non-private methods in a class instance.
+        Class method that executes every setup step of a class instance, in order.
 
         Args:
             instance (Self): An instance of GitignoreSetup. If None, creates a new instance.
 
         Yields:
-            The result of each method call
+            The result of each method call. Failed steps yield nothing; their errors are
+            logged together once every step has run.
 
         Example:
             # As a class method creating its own instance
@@ -131,23 +264,19 @@ class GitignoreSetup:
         if instance is None:
             instance = cls()
 
-        # Get all attributes that are methods
-        for attr_name in dir(instance):
-            # Skip special/private methods and this method itself
-            if attr_name.startswith('_') or attr_name == 'auto_execute_all_methods':
-                continue
+        errors: List[Tuple[str, Exception]] = []
+        for step_name in cls._STEPS:
+            try:
+                yield getattr(instance, step_name)()
+            except Exception as e:
+                errors.append((step_name, e))
 
-            attr = getattr(instance, attr_name)
-            if callable(attr) and not isinstance(attr, type):
-                try:
-                    result = attr()
-                    yield result
-                except Exception as e:
-                    yield f"Error in {attr_name}: {str(e)}"
+        if errors:
+            LOGGER.error("Gitignore setup errors: %s", "; ".join(f"{name}: {e}" for name, e in errors))
 
 
 @command(name="gitignore", help_text="Setup .gitignore in custom directory")
-@dataclass
+@dataclass(slots=True)
 class SetupGitignoreCommand(CommandArgsModel):
     """
     Command to setup .gitignore in custom directory
@@ -26,7 +26,7 @@ from scripts import LOGGER
 
 # Example 1: Simple Hello World Command
 @command(name="hello", help_text="Greet someone with a personalized message")
-@dataclass
+@dataclass(slots=True)
 class HelloCommand(CommandArgsModel):
     """
     Simple greeting command that demonstrates basic command structure.
@@ -74,7 +74,7 @@ class HelloCommand(CommandArgsModel):
 
 # Example 2: User Management Command
 @command(name="user", help_text="Manage user accounts with create and list operations")
-@dataclass
+@dataclass(slots=True)
 class UserCommand(CommandArgsModel):
     """
     Complex user management command that demonstrates advanced features.
@@ -229,7 +229,9 @@ class UserCommand(CommandArgsModel):
 if __name__ == "__main__":
     # 💡 NOTE: This allows the module to be run directly for testing
     from py_clean_cli import package_cli
+    from scripts import configure_logging
 
+    configure_logging()
     print("🚀 Running py-clean-cli examples...")
     print("Available commands: hello, user")
     print()
@@ -1,6 +1,50 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from .decorators import command
-from .models import CommandArgsModel
-from .main import package_cli
+
+if TYPE_CHECKING:
+    # 💡 NOTE: Static imports for type checkers and IDEs; at runtime these names come from `__getattr__`
+    from .models import CommandArgsModel
+    from .main import package_cli
 
 __version__ = "1.0.0"
 __all__ = ["__version__", "command", "CommandArgsModel", "package_cli"]
+
+# 💡 NOTE: PEP 562 lazy exports: `simple_parsing` and the CLI machinery are imported on first access
+_LAZY_EXPORTS = {
+    "CommandArgsModel": "py_clean_cli.models",
+    "package_cli": "py_clean_cli.main",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a lazily exported name on first access and cache it in the module.
+
+    Args:
+        name (str): The attribute being looked up.
+
+    Returns:
+        Any: The exported object.
+
+    Raises:
+        AttributeError: If the name is not a lazy export.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """
+    List the module attributes, including lazy exports not yet imported.
+
+    Returns:
+        List[str]: The sorted attribute names.
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -18,7 +18,7 @@ def command(name: str, help_text: str = ""):
         Callable: The decorator function.
     """
     def decorator(cls):
-        LOGGER.debug(f"Registering command '{name}' in the decorator")
+        LOGGER.debug("Registering command '%s' in the decorator", name)
         COMMAND_REGISTRY.register(name, help_text, cls)
         return cls
     return decorator
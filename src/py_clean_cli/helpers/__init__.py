@@ -1,4 +1,11 @@
+from .paths_helper import PROJECT_ROOT, is_dir, has_init_file
 from .command_registry_helper import COMMAND_REGISTRY
 from .discover_commands_helper import discover_commands
 
-__all__ = ["COMMAND_REGISTRY", "discover_commands"]
+__all__ = [
+    "PROJECT_ROOT",
+    "is_dir",
+    "has_init_file",
+    "COMMAND_REGISTRY",
+    "discover_commands",
+]
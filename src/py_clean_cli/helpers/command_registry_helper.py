@@ -3,41 +3,23 @@ Global registry for CLI commands.
 """
 
 from dataclasses import dataclass, field as dc_field
-from typing import Dict, Type, List, Optional, Any, ClassVar
+from sys import intern
+from typing import Dict, Type, Optional, Any, Tuple
 
 
 @dataclass
 class CommandRegistryHelper:
     """
-    Command registry with cache using singleton pattern.
+    Command registry with cache.
 
-    This registry ensures a single instance exists to manage all CLI commands
+    A single module-level instance (`COMMAND_REGISTRY`) manages all CLI commands
     throughout the application lifecycle.
     """
 
-    _instance: ClassVar[Optional["CommandRegistryHelper"]] = None
     _command_cache: Dict[str, Type[Any]] = dc_field(default_factory=dict, init=False)
-
-    def __new__(cls) -> "CommandRegistryHelper":
-        """
-        Implement singleton pattern to ensure only one registry exists.
-
-        Returns:
-            CommandRegistryHelper: The singleton instance.
-        """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    @classmethod
-    def get_instance(cls) -> "CommandRegistryHelper":
-        """
-        Get the singleton instance of the command registry.
-
-        Returns:
-            CommandRegistryHelper: The singleton registry instance.
-        """
-        return cls()
+    # 💡 NOTE: Bumped on every mutation; `get_all_commands` rebuilds its tuple only when it changed
+    _generation: int = dc_field(default=0, init=False)
+    _all_commands: Tuple[int, Tuple[Type[Any], ...]] = dc_field(default=(-1, ()), init=False)
 
     def register(self, name: str, help_text: str, command_class: Type[Any]) -> None:
         """
@@ -48,18 +30,29 @@ class CommandRegistryHelper:
             help_text (str): Help text for the command.
             command_class (Type[Any]): Class that implements the command.
         """
+        # 💡 NOTE: Interned names are one string object across the registry, the manager tables and the
+        # `_command_dest` namespace default, so lookups with a stored name match by identity. Tokens read
+        # from `sys.argv` are not interned: looking them up still compares characters once the hashes match
+        name = intern(name)
         command_class.command_name = name
         command_class.command_help = help_text
         self._command_cache[name] = command_class
+        self._generation += 1
 
-    def get_all_commands(self) -> List[Type[Any]]:
+    def get_all_commands(self) -> Tuple[Type[Any], ...]:
         """
         Returns all registered commands.
 
+        The tuple is cached and shared between calls until the registry changes.
+
         Returns:
-            List[Type[Any]]: List of all registered command classes.
+            Tuple[Type[Any], ...]: All registered command classes, in registration order.
         """
-        return list(self._command_cache.values())
+        generation, commands = self._all_commands
+        if generation != self._generation:
+            commands = tuple(self._command_cache.values())
+            self._all_commands = (self._generation, commands)
+        return commands
 
     def get_command(self, name: str) -> Optional[Type[Any]]:
         """
@@ -78,7 +71,29 @@ class CommandRegistryHelper:
         Clear the command registry.
         """
         self._command_cache.clear()
+        self._generation += 1
+
+    def snapshot(self) -> Dict[str, Type[Any]]:
+        """
+        Returns a shallow copy of the registered commands.
+
+        Returns:
+            Dict[str, Type[Any]]: Command names mapped to their classes, to be passed to `restore()`.
+        """
+        return dict(self._command_cache)
+
+    def restore(self, snapshot: Dict[str, Type[Any]]) -> None:
+        """
+        Replace the registered commands with a snapshot taken by `snapshot()`.
+
+        Args:
+            snapshot (Dict[str, Type[Any]]): The commands to restore.
+        """
+        # 💡 NOTE: Updated in place so references to the cache dict stay valid
+        self._command_cache.clear()
+        self._command_cache.update(snapshot)
+        self._generation += 1
 
 
-# 💡 NOTE: Global convenience variable for backward compatibility
-COMMAND_REGISTRY = CommandRegistryHelper.get_instance()
+# 💡 NOTE: The module-level instance is the registry; import it instead of instantiating the class
+COMMAND_REGISTRY = CommandRegistryHelper()
@@ -1,17 +1,31 @@
-from sys import path as sys_path
+from os import DirEntry, scandir, fspath, sep, altsep, stat
+from os.path import join, normcase, splitext
+from sys import modules as sys_modules
 from pathlib import Path
-from typing import List
-from inspect import getmodule, getfile
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple, Union
 from importlib import import_module
-from importlib.util import spec_from_file_location, module_from_spec
 from logging import getLogger, Logger, exception as log_exception
 
+from py_clean_cli.helpers.paths_helper import PROJECT_ROOT
+
 # 💡 NOTE: Using logger instance (not direct imports) for better namespace control in library code
 LOGGER: Logger = getLogger(__name__)
 
-PROJECT_ROOT: str = str(Path.cwd())
-if PROJECT_ROOT not in sys_path:
-    sys_path.insert(0, PROJECT_ROOT)
+# 💡 NOTE: Precomputed once so module paths are derived with plain string operations
+_ROOT_PREFIX: str = normcase(join(PROJECT_ROOT, ""))
+
+_PY_SUFFIX: str = ".py"
+
+# 💡 NOTE: A file that mentions none of these cannot declare a command, so it is never executed.
+# The bare `command` also matches qualified uses (`@pcc.command(...)`) and aliased imports
+# (`from py_clean_cli import command as cli`); it is case-sensitive, hence `CommandArgsModel` too
+_COMMAND_MARKERS: Tuple[bytes, ...] = (b"command", b"CommandArgsModel")
+
+# 💡 NOTE: Modules loaded by the source fallback are not in `sys.modules`, so they are tracked by file
+# path, modification time and size: an unchanged file is not executed again, an edited one is.
+# Files skipped by the marker prefilter are stored as None
+_IMPORT_CACHE: Dict[Tuple[str, int, int], Optional[ModuleType]] = {}
 
 
 def discover_commands(package_path: str) -> None:
@@ -24,11 +38,10 @@ def discover_commands(package_path: str) -> None:
     Args:
         package_path (str): Path to the package directory containing commands.
     """
-    LOGGER.debug(f"Discovering commands in package: {package_path}")
-    python_files = _find_python_files(package_path)
-
-    for file in python_files:
-        _import_module_from_file(file)
+    LOGGER.debug("Discovering commands in package: %s", package_path)
+    # 💡 NOTE: Directory entries are passed down so the importer reuses their `stat()` result
+    for entry in _scan_python_entries(package_path):
+        _import_module_from_file(entry)
 
 
 def _find_python_files(package_path: str) -> List[Path]:
@@ -41,47 +54,161 @@ def _find_python_files(package_path: str) -> List[Path]:
     Returns:
         List[Path]: List of Path objects for Python files (excluding those starting with underscore)
     """
-    package_dir = Path(package_path)
-    LOGGER.debug(f"Searching for Python files in: {package_dir}")
+    return [Path(entry.path) for entry in _scan_python_entries(package_path)]
+
+
+def _scan_python_entries(package_path: str) -> List[DirEntry]:
+    """
+    Recursively collects the directory entries of Python files using `os.scandir`.
+
+    Entry names and types come from the directory listing itself, so no extra
+    `stat()` call or `Path` object is needed per entry. Files of a directory are
+    listed before the files of its subdirectories. Symlinked directories are not
+    followed, `__pycache__` directories are skipped, and directories that cannot
+    be listed (e.g. `PermissionError`) are skipped with a warning.
+
+    Args:
+        package_path (str): Directory path to search for Python files.
+
+    Returns:
+        List[DirEntry]: Entries of Python files (excluding those starting with underscore)
+    """
+    LOGGER.debug("Searching for Python files in: %s", package_path)
+    files: List[DirEntry] = []
+    pending: List[str] = [package_path]
+    # 💡 NOTE: Bound once, outside the per-entry loop
+    add_file = files.append
+
+    while pending:
+        directory = pending.pop()
+        subdirs: List[str] = []
+        try:
+            with scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name != "__pycache__":
+                            subdirs.append(entry.path)
+                    elif name[:1] != "_" and name.endswith(_PY_SUFFIX):
+                        add_file(entry)
+        except OSError as e:
+            LOGGER.warning("Skipping unreadable directory %s: %s", directory, e)
+            continue
+        pending.extend(reversed(subdirs))
+
+    return files
+
+
+def _module_path_from_file(file_path: str) -> str:
+    """
+    Converts a Python file path under the project root into a dotted module path.
+
+    Args:
+        file_path (str): Path to the Python file.
+
+    Returns:
+        str: The dotted module path (e.g. `scripts.examples.use_commands`).
+
+    Raises:
+        ValueError: If the file is not located under the project root.
+    """
+    if not normcase(file_path).startswith(_ROOT_PREFIX):
+        raise ValueError(f"'{file_path}' is not in the subpath of '{PROJECT_ROOT}'")
+
+    relative_path = splitext(file_path[len(_ROOT_PREFIX):])[0]
+    if altsep:
+        relative_path = relative_path.replace(altsep, sep)
+    return relative_path.replace(sep, ".")
 
-    # Find all .py files, excluding those starting with underscore
-    return [file for file in package_dir.rglob("*.py") if not file.name.startswith("_")]
 
+def _import_cache_key(file: Union[str, Path, DirEntry]) -> Optional[Tuple[str, int, int]]:
+    """
+    Builds the `_IMPORT_CACHE` key of a Python file.
+
+    Args:
+        file (Union[str, Path, DirEntry]): The Python file. A `DirEntry` reuses the
+            `stat()` result cached by the directory scan.
 
-def _import_module_from_file(file: Path) -> None:
+    Returns:
+        Optional[Tuple[str, int, int]]: The path with its `st_mtime_ns` and `st_size`,
+            or None if the file cannot be stat'ed.
+    """
+    try:
+        file_stat = file.stat() if isinstance(file, DirEntry) else stat(file)
+    except OSError:
+        return None
+    return (fspath(file), file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _import_module_from_file(file: Union[str, Path, DirEntry]) -> None:
     """
     Imports a Python module from a file path.
 
-    Attempts standard import first, falls back to spec-based import if needed.
+    Modules already in `sys.modules` are skipped before the file is read. Files
+    whose source mentions neither `command` nor `CommandArgsModel` are skipped
+    without being imported. Otherwise, attempts standard import first, falls back
+    to executing the source file directly if needed. Files already loaded by the
+    fallback (or skipped) are not read again unless they changed on disk since.
 
     Args:
-        file (Path): Path to the Python file to import.
+        file (Union[str, Path, DirEntry]): The Python file to import.
     """
+    file_path = fspath(file)
     try:
         # Try standard relative import first
-        rel_path = file.relative_to(Path(PROJECT_ROOT))
-        parts = rel_path.with_suffix("").parts
-        module_path = ".".join(parts)
+        module_path: Optional[str] = _module_path_from_file(file_path)
+    except ValueError as e:
+        module_path, path_error = None, e
+
+    # 💡 NOTE: Checked before any stat() or read, so repeat discoveries of imported modules cost no I/O
+    if module_path is not None and module_path in sys_modules:
+        LOGGER.debug("Module already imported: %s", module_path)
+        return
+
+    cache_key = _import_cache_key(file)
+    if cache_key in _IMPORT_CACHE:
+        LOGGER.debug("Module %s already loaded from source, skipping", file_path)
+        return
+
+    try:
+        with open(file_path, "rb") as source_file:
+            source = source_file.read()
+    except OSError as e:
+        LOGGER.warning("Cannot read %s: %s", file_path, e)
+        return
+
+    if not any(marker in source for marker in _COMMAND_MARKERS):
+        LOGGER.debug("No command declared in %s, skipping", file_path)
+        if cache_key is not None:
+            _IMPORT_CACHE[cache_key] = None
+        return
+
+    try:
+        if module_path is None:
+            raise path_error
 
-        LOGGER.debug(f"Importing module: {module_path}")
+        LOGGER.debug("Importing module: %s", module_path)
         import_module(module_path)
-        LOGGER.debug(f"Successfully imported: {module_path}")
+        LOGGER.debug("Successfully imported: %s", module_path)
 
     except (ImportError, ValueError) as e:
-        LOGGER.warning(f"Error importing module {file.name}: {e}")
+        file = Path(file_path)
+        LOGGER.warning("Error importing module %s: %s", file.name, e)
 
-        # ⚠️ Try alternative import using spec
+        # ⚠️ Try alternative import straight from source
         try:
+            # 💡 NOTE: compile() + exec() of the source already read for the prefilter: no ModuleSpec,
+            # loader or bytecode cache lookup. Named after the file stem only, so it is kept out of `sys.modules`
             module_name = file.stem
-            spec = spec_from_file_location(module_name, file)
+            code = compile(source, file_path, "exec")
 
-            if spec and spec.loader:
-                module = module_from_spec(spec)
-                spec.loader.exec_module(module)
-                LOGGER.info(f"Module {module_name} imported successfully using spec")
-            else:
-                LOGGER.warning(f"Could not create spec for {file}")
+            module = ModuleType(module_name)
+            module.__file__ = file_path
+            exec(code, module.__dict__)
+            if cache_key is not None:
+                _IMPORT_CACHE[cache_key] = module
+            LOGGER.info("Module %s imported successfully from source", module_name)
 
         except Exception:
             # 💡 NOTE: Using exception() for automatic stacktrace (following CLAUDE.md guidelines)
-            log_exception(f"Failed to import {file.name} using spec")
+            log_exception("Failed to import %s from source", file.name)
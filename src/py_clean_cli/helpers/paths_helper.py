@@ -0,0 +1,40 @@
+"""
+Project paths and filesystem checks resolved once per process.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from sys import path as sys_path
+
+# 💡 NOTE: Single source of truth for the project root, computed once at import time
+PROJECT_ROOT: str = str(Path.cwd())
+if PROJECT_ROOT not in sys_path:
+    sys_path.insert(0, PROJECT_ROOT)
+
+
+@lru_cache(maxsize=None)
+def is_dir(path: str) -> bool:
+    """
+    Check whether a path is a directory, caching the result.
+
+    Args:
+        path (str): The path to check.
+
+    Returns:
+        bool: True if the path is an existing directory.
+    """
+    return Path(path).is_dir()
+
+
+@lru_cache(maxsize=None)
+def has_init_file(path: str) -> bool:
+    """
+    Check whether a directory contains an `__init__.py` file, caching the result.
+
+    Args:
+        path (str): The directory to check.
+
+    Returns:
+        bool: True if `__init__.py` exists in the directory.
+    """
+    return (Path(path) / "__init__.py").exists()
@@ -1,22 +1,25 @@
 from pathlib import Path
-from sys import argv as sys_argv
+from sys import argv as sys_argv, _getframe
 from typing import Optional
 from logging import getLogger, DEBUG, Logger
-from inspect import getmodule, getfile, stack
+from inspect import getmodule, getfile
 
-from simple_parsing import ArgumentParser
-
-from py_clean_cli.helpers import discover_commands
-from py_clean_cli.services import CommandsManager
+from py_clean_cli.helpers import discover_commands, is_dir, has_init_file
 
 # 💡 NOTE: Using logger instance (not direct imports) for better namespace control in library code
 LOGGER: Logger = getLogger(__name__)
 
+# 💡 NOTE: Served before command discovery, so asking for the version never imports command modules
+VERSION_FLAGS = ("--version", "-V")
+
 
 def package_cli(package_path: Optional[str] = None) -> None:
     """
     Set up the CLI for the package.
 
+    `--version` (or `-V`) as the first argument prints the version and returns
+    before any command module is discovered.
+
     Args:
         package_path (Optional[str]): Path to the package directory. If None, attempts to
             determine it from the calling module.
@@ -31,34 +34,47 @@ def package_cli(package_path: Optional[str] = None) -> None:
 
     if package_path is None:
         # Get the frame of the caller (1 level up in the stack)
-        caller_frame = stack()[1]
-        caller_module = getmodule(caller_frame[0])
+        # 💡 NOTE: `_getframe` returns the frame directly; `inspect.stack()` would read source lines for every frame
+        caller_frame = _getframe(1)
+        caller_module = getmodule(caller_frame)
         if caller_module is None:
             raise ValueError("Could not determine the caller module.")
         module_file = getfile(caller_module)
         package_path = str(Path(module_file).parent)
 
-    if not Path(package_path).is_dir():
+    if not is_dir(package_path):
         raise ValueError(f"The provided package_path '{package_path}' is not a valid directory.")
 
     # Log information about the package
     module_name = Path(package_path).name
-    LOGGER.debug(f"Called from module: {module_name}")
-    LOGGER.debug(f"Module file path: {package_path}")
+    LOGGER.debug("Called from module: %s", module_name)
+    LOGGER.debug("Module file path: %s", package_path)
 
     # Check if it's a valid Python package (has __init__.py)
-    init_file = Path(package_path) / "__init__.py"
-    if not init_file.exists():
+    if not has_init_file(package_path):
         LOGGER.warning(
-            f"The directory '{package_path}' does not contain __init__.py file. "
-            "It may not be a valid Python package."
+            "The directory '%s' does not contain __init__.py file. "
+            "It may not be a valid Python package.",
+            package_path,
         )
     else:
         LOGGER.debug(
-            f"Confirmed: '{package_path}' is a valid Python package with __init__.py file."
+            "Confirmed: '%s' is a valid Python package with __init__.py file.", package_path
         )
 
+    if len(sys_argv) > 1 and sys_argv[1] in VERSION_FLAGS:
+        from py_clean_cli import __version__
+
+        print(f"{module_name} (py-clean-cli {__version__})")
+        return
+
     discover_commands(package_path)
+
+    # 💡 NOTE: Deferred imports: the manager pulls in `simple_parsing` (through the command models),
+    # so importing `py_clean_cli.main` or answering `--version` does not load it
+    from simple_parsing import ArgumentParser
+    from py_clean_cli.services import CommandsManager
+
     parser = ArgumentParser(prog=module_name)
     manager = CommandsManager.get_instance(parser)
 
@@ -1,14 +1,13 @@
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import ClassVar
 
 from simple_parsing import field
 
 
-@dataclass(kw_only=True)
-class CommandArgsAbstract(ABC):
+@dataclass(kw_only=True, slots=True)
+class CommandArgsAbstract:
     """
-    Abstract base class for command arguments.
+    Base class for command arguments.
 
     This class defines the common interface and default arguments
     that all command implementations should inherit from.
@@ -35,7 +34,8 @@ class CommandArgsAbstract(ABC):
         help="Set the logging level (DEBUG or INFO)."
     )
 
-    @abstractmethod
+    # 💡 NOTE: No ABC/@abstractmethod: the raising default enforces the contract when called,
+    # without an abstract-methods check on every instantiation
     def exec(self) -> None:
         """
         Execute the command logic.
@@ -49,7 +49,7 @@ class CommandArgsAbstract(ABC):
         raise NotImplementedError("Subclasses must implement the `exec()` method.")
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandArgsModel(CommandArgsAbstract):
     """
     Concrete implementation of CommandArgsAbstract.
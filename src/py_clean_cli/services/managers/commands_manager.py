@@ -1,17 +1,21 @@
-from dataclasses import dataclass, field as dc_field
+# 💡 NOTE: Reading `sys.argv` at call time (not `from sys import argv`) so a rebound argv is honored
+import sys
+from functools import partial
 from logging import getLogger, Logger
-from typing import Any, Dict, Type, ClassVar, Set
+from typing import TYPE_CHECKING, Any, Callable, Dict, Type, Optional, Sequence
 
-from simple_parsing import ArgumentParser
+if TYPE_CHECKING:
+    # 💡 NOTE: Only needed for annotations; the parser instance is always created by the caller
+    from simple_parsing import ArgumentParser
 
 from py_clean_cli.helpers import COMMAND_REGISTRY
 from py_clean_cli.models import CommandArgsModel
 
 # 💡 NOTE: Using logger instance (not direct imports) for better namespace control in library code
+# 💡 NOTE: %-style arguments are only formatted when a record is emitted (no cost with DEBUG off)
 LOGGER: Logger = getLogger(__name__)
 
 
-@dataclass
 class CommandsManager:
     """
     Commands manager that handles registration and execution of CLI commands.
@@ -23,48 +27,61 @@ class CommandsManager:
         parser: The main argument parser instance.
         subparsers: Subparser for handling multiple commands.
         commands: Dictionary mapping command names to their classes.
-        _registered_parsers: Set of already registered parser names.
+        _pending_arguments: Deferred `add_arguments` calls, by command name.
     """
 
-    _instances: ClassVar[Dict[int, "CommandsManager"]] = {}
-
-    parser: ArgumentParser
-    subparsers: Any = None
-    commands: Dict[str, Type[CommandArgsModel]] = dc_field(default_factory=dict)
-    _registered_parsers: Set[str] = dc_field(default_factory=set, init=False)
-    _initialized: bool = dc_field(default=False, init=False)
-
-    def __post_init__(self):
-        """
-        Initialize the subparsers after instance creation.
-
-        Only initializes if not already initialized (for singleton pattern).
-        """
-        if not self._initialized:
-            self.subparsers = self.parser.add_subparsers(dest="command", required=True)
-            self._initialized = True
-            LOGGER.debug("Initialized subparsers for command handling")
-
-    def __new__(cls, parser: ArgumentParser):
+    __slots__ = (
+        "parser",
+        "subparsers",
+        "commands",
+        "_pending_arguments",
+        "_initialized",
+        "__weakref__",
+    )
+
+    parser: "ArgumentParser"
+    subparsers: Any
+    commands: Dict[str, Type[CommandArgsModel]]
+    _pending_arguments: Dict[str, Callable[[], None]]
+    _initialized: bool
+
+    def __new__(cls, parser: "ArgumentParser"):
         """
         Implement singleton pattern per parser instance.
         """
-        parser_id = id(parser)
-        if parser_id not in cls._instances:
-            LOGGER.debug(
-                "Creating new CommandsManager instance for parser ID: " f"{parser_id}"
-            )
+        # 💡 NOTE: The manager lives on its parser: one attribute read, and both are collected together
+        instance = getattr(parser, "_commands_manager", None)
+        if instance is None:
+            LOGGER.debug("Creating new CommandsManager instance for parser: %s", parser.prog)
             instance = super().__new__(cls)
-            cls._instances[parser_id] = instance
+            instance._initialized = False
+            parser._commands_manager = instance
         else:
-            LOGGER.debug(
-                "Reusing existing CommandsManager instance for parser ID: "
-                f"{parser_id}"
-            )
-        return cls._instances[parser_id]
+            LOGGER.debug("Reusing existing CommandsManager instance for parser: %s", parser.prog)
+        return instance
+
+    def __init__(self, parser: "ArgumentParser"):
+        """
+        Initialize the manager state and the subparsers of the parser.
+
+        Runs only once per instance: `__new__` returns the existing manager for a known
+        parser, and Python calls `__init__` again on it, which must keep its commands.
+
+        Args:
+            parser (ArgumentParser): The main argument parser instance.
+        """
+        if self._initialized:
+            return
+
+        self.parser = parser
+        self.commands = {}
+        self._pending_arguments = {}
+        self.subparsers = parser.add_subparsers(dest="command", required=True)
+        self._initialized = True
+        LOGGER.debug("Initialized subparsers for command handling")
 
     @classmethod
-    def get_instance(cls, parser: ArgumentParser) -> "CommandsManager":
+    def get_instance(cls, parser: "ArgumentParser") -> "CommandsManager":
         """
         Get or create a manager instance (singleton per parser).
 
@@ -82,6 +99,8 @@ class CommandsManager:
         """
         Register a command in the manager using its internal metadata.
 
+        Only the subparser (name and help) is created here. The dataclass arguments
+        are added lazily by `parse_and_execute()`, and only for the selected command.
         The command will not be registered again if already present.
 
         Args:
@@ -91,18 +110,19 @@ class CommandsManager:
             CommandsManager: Self for method chaining.
         """
         name = command_class.command_name
-        if name in self._registered_parsers:
-            LOGGER.debug(f"Command '{name}' already registered, skipping")
+        if name in self.commands:
+            LOGGER.debug("Command '%s' already registered, skipping", name)
             return self
 
         help_text = command_class.command_help
-        LOGGER.debug(f"Registering command '{name}' with help: '{help_text}'")
+        LOGGER.debug("Registering command '%s' with help: '%s'", name, help_text)
 
         subparser = self.subparsers.add_parser(name=name, help=help_text)
-        subparser.add_arguments(command_class, dest=name)
+        # 💡 NOTE: Parsed namespaces carry the attribute name of their command config
+        subparser.set_defaults(_command_dest=name)
+        self._pending_arguments[name] = partial(subparser.add_arguments, command_class, dest=name)
         self.commands[name] = command_class
-        self._registered_parsers.add(name)
-        LOGGER.debug(f"Command '{name}' successfully registered")
+        LOGGER.debug("Command '%s' successfully registered", name)
         return self
 
     def register_all_commands(self) -> "CommandsManager":
@@ -113,7 +133,7 @@ class CommandsManager:
             CommandsManager: Self for method chaining.
         """
         all_commands = COMMAND_REGISTRY.get_all_commands()
-        LOGGER.debug(f"Found {len(all_commands)} commands in registry")
+        LOGGER.debug("Found %d commands in registry", len(all_commands))
 
         if not all_commands:
             LOGGER.warning(
@@ -121,10 +141,9 @@ class CommandsManager:
             )
 
         for cmd_class in all_commands:
-            LOGGER.debug(f"Registering command: {cmd_class.command_name}")
             self.register_command(cmd_class)
 
-        LOGGER.debug(f"Total registered commands: {len(self._registered_parsers)}")
+        LOGGER.debug("Total registered commands: %d", len(self.commands))
         return self
 
     def get_command_class(self, command_name: str) -> Type[CommandArgsModel]:
@@ -140,40 +159,71 @@ class CommandsManager:
         Raises:
             ValueError: If the command is unknown.
         """
-        if command_name not in self.commands:
+        cmd_class = self.commands.get(command_name)
+        if cmd_class is None:
             LOGGER.debug(
-                f"Command '{command_name}' not in local registry, checking global registry"
+                "Command '%s' not in local registry, checking global registry", command_name
             )
             cmd_class = COMMAND_REGISTRY.get_command(command_name)
-            if cmd_class:
-                LOGGER.debug(
-                    f"Found command '{command_name}' in global registry, registering"
-                )
-                self.register_command(cmd_class)
-            else:
-                LOGGER.error(f"Unknown command: {command_name}")
+            if cmd_class is None:
+                LOGGER.error("Unknown command: %s", command_name)
                 raise ValueError(f"Unknown command: {command_name}")
-        return self.commands[command_name]
+            LOGGER.debug("Found command '%s' in global registry, registering", command_name)
+            self.register_command(cmd_class)
+        return cmd_class
+
+    def build_command_arguments(self, command_name: str) -> None:
+        """
+        Add the dataclass arguments of a registered command to its subparser.
+
+        Does nothing if the command is unknown or its arguments were already added.
+
+        Args:
+            command_name (str): The name of the command to build.
+        """
+        add_arguments = self._pending_arguments.pop(command_name, None)
+        if add_arguments is None:
+            return
 
-    def parse_and_execute(self) -> None:
+        add_arguments()
+        LOGGER.debug("Arguments for command '%s' added to its subparser", command_name)
+
+    def parse_and_execute(self, args: Optional[Sequence[str]] = None) -> None:
         """
         Parse arguments, instantiate the appropriate command and execute it.
 
         This method handles the complete flow from argument parsing to
-        command execution.
-        """
-        try:
-            args = self.parser.parse_args()
+        command execution. When the first argument names a registered command,
+        only that command gets its dataclass arguments built, and the remaining
+        arguments are parsed by its subparser alone. Otherwise every command
+        named in the arguments is built before the main parser runs, so options
+        of the main parser may precede the command.
 
-            command_name = args.command
-            LOGGER.debug(f"Executing command: {command_name}")
+        Args:
+            args (Optional[Sequence[str]]): Arguments to parse. Defaults to `sys.argv[1:]`.
+        """
+        argv = list(sys.argv[1:] if args is None else args)
+
+        # 💡 NOTE: Fast path skips the top-level parser; anything else (help, typos) goes through it
+        subparser = self.subparsers.choices.get(argv[0]) if argv else None
+        if subparser is not None:
+            # 💡 NOTE: Later tokens are option values here (`hello --name user`), never commands
+            self.build_command_arguments(argv[0])
+            namespace = subparser.parse_args(argv[1:])
+        else:
+            # 💡 NOTE: `--help` alone needs no command arguments; the subparsers already carry their help
+            for token in argv:
+                if token in self._pending_arguments:
+                    self.build_command_arguments(token)
+            namespace = self.parser.parse_args(argv)
 
-            command_config = args.__dict__[command_name]
-            LOGGER.debug(f"Command configuration: {command_config}")
+        command_name = namespace._command_dest
+        command_config = getattr(namespace, command_name)
+        LOGGER.debug("Executing command: %s", command_name)
 
+        try:
             command_config.exec()
-            LOGGER.debug(f"Command '{command_name}' execution completed")
-
         except Exception as e:
-            LOGGER.error(f"Error during command execution: {e}")
+            LOGGER.error("Error during command execution: %s", e)
             raise
+        LOGGER.debug("Command '%s' execution completed", command_name)
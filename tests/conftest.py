@@ -23,16 +23,19 @@ def reset_registry():
     """
     from py_clean_cli.helpers import COMMAND_REGISTRY
 
-    # Store original state
-    original_cache = COMMAND_REGISTRY._command_cache.copy()
+    # Store original state (nothing to copy when the registry is already empty)
+    snapshot = COMMAND_REGISTRY.snapshot() if COMMAND_REGISTRY._command_cache else None
 
     # Clear for test
     COMMAND_REGISTRY.clear_registry()
 
-    yield
-
-    # Restore original state
-    COMMAND_REGISTRY._command_cache = original_cache
+    try:
+        yield
+    finally:
+        if snapshot:
+            COMMAND_REGISTRY.restore(snapshot)
+        else:
+            COMMAND_REGISTRY.clear_registry()
 
 
 @pytest.fixture
@@ -174,3 +174,18 @@ class TestCommandDecorator:
         # Test they are different instances
         assert cmd1 is not cmd2
         assert cmd1.field1 != cmd2.field1
+
+    def test_decorator_integration_with_slots_dataclass(self):
+        """Test that @command works with @dataclass(slots=True)."""
+        @command(name="slotted", help_text="Slotted command")
+        @dataclass(slots=True)
+        class SlottedCommand(CommandArgsModel):
+            field1: str = "default1"
+
+            def exec(self) -> None:
+                return self.field1
+
+        assert COMMAND_REGISTRY.get_command("slotted") is SlottedCommand
+        assert SlottedCommand.command_name == "slotted"
+        assert "field1" in SlottedCommand.__slots__
+        assert SlottedCommand(field1="custom").exec() == "custom"
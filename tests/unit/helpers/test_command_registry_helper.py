@@ -1,10 +1,11 @@
 """
 Tests for CommandRegistryHelper class.
 
-This module tests the singleton pattern, command registration,
+This module tests the global registry instance, command registration,
 retrieval, and cache management functionality.
 """
 
+import sys
 from dataclasses import dataclass
 
 import pytest
@@ -17,20 +18,17 @@ from py_clean_cli.models import CommandArgsModel
 class TestCommandRegistryHelper:
     """Test suite for CommandRegistryHelper class."""
 
-    def test_singleton_pattern(self):
-        """Test that CommandRegistryHelper implements singleton pattern."""
-        instance1 = CommandRegistryHelper()
-        instance2 = CommandRegistryHelper()
-        instance3 = CommandRegistryHelper.get_instance()
+    def test_global_registry_is_module_instance(self):
+        """Test that COMMAND_REGISTRY is a CommandRegistryHelper instance."""
+        assert isinstance(COMMAND_REGISTRY, CommandRegistryHelper)
 
-        assert instance1 is instance2
-        assert instance2 is instance3
-        assert id(instance1) == id(instance2) == id(instance3)
+    def test_decorator_and_manager_share_global_registry(self):
+        """Test that the decorator and the manager use the same registry instance."""
+        from py_clean_cli.decorators import command_decorator
+        from py_clean_cli.services.managers import commands_manager
 
-    def test_global_registry_is_singleton(self):
-        """Test that COMMAND_REGISTRY is the singleton instance."""
-        instance = CommandRegistryHelper.get_instance()
-        assert COMMAND_REGISTRY is instance
+        assert command_decorator.COMMAND_REGISTRY is COMMAND_REGISTRY
+        assert commands_manager.COMMAND_REGISTRY is COMMAND_REGISTRY
 
     def test_register_command(self, sample_command_class):
         """Test registering a command in the registry."""
@@ -48,6 +46,13 @@ class TestCommandRegistryHelper:
         assert sample_command_class.command_name == "test_cmd"
         assert sample_command_class.command_help == "Test command"
 
+    def test_register_interns_command_name(self, sample_command_class):
+        """Test that registered command names are interned."""
+        name = "".join(["interned", "_cmd"])
+        COMMAND_REGISTRY.register(name, "Test command", sample_command_class)
+
+        assert sample_command_class.command_name is sys.intern("interned_cmd")
+
     def test_register_multiple_commands(self, sample_command_class):
         """Test registering multiple commands."""
         @dataclass
@@ -94,7 +99,7 @@ class TestCommandRegistryHelper:
         """Test getting all commands when registry is empty."""
         commands = COMMAND_REGISTRY.get_all_commands()
 
-        assert isinstance(commands, list)
+        assert isinstance(commands, tuple)
         assert len(commands) == 0
 
     def test_get_all_commands_multiple(self, sample_command_class):
@@ -120,6 +125,22 @@ class TestCommandRegistryHelper:
         assert Command2 in commands
         assert sample_command_class in commands
 
+    def test_get_all_commands_is_cached_until_registry_changes(self, sample_command_class):
+        """Test that get_all_commands reuses its tuple until a command is registered."""
+        COMMAND_REGISTRY.register("cmd1", "Command 1", sample_command_class)
+
+        first = COMMAND_REGISTRY.get_all_commands()
+        assert COMMAND_REGISTRY.get_all_commands() is first
+
+        @dataclass
+        class LaterCommand(CommandArgsModel):
+            def exec(self) -> None:
+                pass
+
+        COMMAND_REGISTRY.register("cmd2", "Command 2", LaterCommand)
+
+        assert COMMAND_REGISTRY.get_all_commands() == (sample_command_class, LaterCommand)
+
     def test_clear_registry(self, sample_command_class):
         """Test clearing the command registry."""
         # Register some commands
@@ -132,7 +153,23 @@ class TestCommandRegistryHelper:
         COMMAND_REGISTRY.clear_registry()
 
         assert len(COMMAND_REGISTRY._command_cache) == 0
-        assert COMMAND_REGISTRY.get_all_commands() == []
+        assert COMMAND_REGISTRY.get_all_commands() == ()
+
+    def test_snapshot_and_restore(self, sample_command_class):
+        """Test that restore() brings back the commands captured by snapshot()."""
+        COMMAND_REGISTRY.register("kept", "Kept", sample_command_class)
+        snapshot = COMMAND_REGISTRY.snapshot()
+
+        @dataclass
+        class TemporaryCommand(CommandArgsModel):
+            def exec(self) -> None:
+                pass
+
+        COMMAND_REGISTRY.register("temporary", "Temporary", TemporaryCommand)
+        COMMAND_REGISTRY.restore(snapshot)
+
+        assert COMMAND_REGISTRY.get_command("temporary") is None
+        assert COMMAND_REGISTRY.get_all_commands() == (sample_command_class,)
 
     def test_registry_isolation_between_tests(self, sample_command_class):
         """
@@ -5,6 +5,8 @@ This module tests command discovery, Python file finding,
 and module importing functionality.
 """
 
+import os
+import sys
 from pathlib import Path
 from unittest.mock import patch, Mock
 
@@ -15,7 +17,11 @@ from py_clean_cli.helpers.discover_commands_helper import (
     discover_commands,
     _find_python_files,
     _import_module_from_file,
+    _module_path_from_file,
+    _IMPORT_CACHE,
+    _import_cache_key,
 )
+from py_clean_cli.helpers.paths_helper import PROJECT_ROOT
 
 
 class TestFindPythonFiles:
@@ -102,6 +108,38 @@ class TestFindPythonFiles:
         assert file3 in files
         assert file4 in files
 
+    def test_finds_files_in_underscore_directories(self, tmp_path):
+        """Test that only file names are filtered by the underscore rule, not directories."""
+        private_dir = tmp_path / "_configs"
+        private_dir.mkdir()
+
+        nested_file = private_dir / "setup.py"
+        nested_file.write_text("# Setup")
+
+        files = _find_python_files(str(tmp_path))
+
+        assert files == [nested_file]
+
+    def test_skips_unreadable_directories(self, tmp_path):
+        """Test that a directory raising PermissionError is skipped."""
+        root_file = tmp_path / "root.py"
+        root_file.write_text("# Root")
+        locked_dir = tmp_path / "locked"
+        locked_dir.mkdir()
+        (locked_dir / "hidden.py").write_text("# Hidden")
+
+        real_scandir = os.scandir
+
+        def fake_scandir(path):
+            if path == str(locked_dir):
+                raise PermissionError("Permission denied")
+            return real_scandir(path)
+
+        with patch("py_clean_cli.helpers.discover_commands_helper.scandir", fake_scandir):
+            files = _find_python_files(str(tmp_path))
+
+        assert files == [root_file]
+
     def test_ignores_non_python_files(self, tmp_path):
         """Test that non-Python files are ignored."""
         py_file = tmp_path / "test.py"
@@ -120,6 +158,21 @@ class TestFindPythonFiles:
         assert py_file in files
 
 
+class TestModulePathFromFile:
+    """Test suite for _module_path_from_file function."""
+
+    def test_file_under_project_root(self):
+        """Test converting a file under the project root into a dotted path."""
+        file_path = os.path.join(PROJECT_ROOT, "scripts", "examples", "use_commands.py")
+
+        assert _module_path_from_file(file_path) == "scripts.examples.use_commands"
+
+    def test_file_outside_project_root_raises(self, tmp_path):
+        """Test that files outside the project root raise ValueError."""
+        with pytest.raises(ValueError, match="is not in the subpath"):
+            _module_path_from_file(str(tmp_path / "outside.py"))
+
+
 class TestImportModuleFromFile:
     """Test suite for _import_module_from_file function."""
 
@@ -148,18 +201,164 @@ class ImportedCommand(CommandArgsModel):
         print("Imported command executed")
 """)
 
-        # Clear registry before import
-        COMMAND_REGISTRY.clear_registry()
-
         _import_module_from_file(test_file)
 
         # Verify command was registered
         assert "imported_cmd" in COMMAND_REGISTRY._command_cache
 
+    def test_import_already_imported_module_is_skipped(self, tmp_path, monkeypatch):
+        """Test that modules already in sys.modules are neither read nor imported again."""
+        package_dir = tmp_path / "cached_pkg"
+        package_dir.mkdir()
+        test_file = package_dir / "cached_module.py"
+        test_file.write_text("from py_clean_cli import CommandArgsModel\n")
+
+        monkeypatch.setattr(
+            "py_clean_cli.helpers.discover_commands_helper._ROOT_PREFIX",
+            os.path.join(os.path.normcase(str(tmp_path)), ""),
+        )
+        monkeypatch.setitem(sys.modules, "cached_pkg.cached_module", Mock())
+
+        with patch(
+            "py_clean_cli.helpers.discover_commands_helper.import_module"
+        ) as mock_import, patch("builtins.open") as mock_open:
+            _import_module_from_file(test_file)
+
+        mock_import.assert_not_called()
+        mock_open.assert_not_called()
+
+    def test_import_module_twice_skips_second_execution(self, tmp_path):
+        """Test that a file loaded by the source fallback is not executed again."""
+        test_file = tmp_path / "loaded_once.py"
+        test_file.write_text("""
+from dataclasses import dataclass
+from py_clean_cli import command, CommandArgsModel
+
+@command(name="loaded_once", help_text="Loaded once")
+@dataclass
+class LoadedOnceCommand(CommandArgsModel):
+    def exec(self) -> None:
+        pass
+""")
+
+        _import_module_from_file(test_file)
+        COMMAND_REGISTRY.clear_registry()
+
+        _import_module_from_file(test_file)
+
+        assert _import_cache_key(str(test_file)) in _IMPORT_CACHE
+        assert COMMAND_REGISTRY.get_command("loaded_once") is None
+
+    def test_import_module_from_dir_entry(self, tmp_path):
+        """Test that a DirEntry is imported and cached under its path."""
+        test_file = tmp_path / "from_entry.py"
+        test_file.write_text("from py_clean_cli import CommandArgsModel\nVALUE = 1\n")
+
+        with os.scandir(tmp_path) as entries:
+            entry = next(entries)
+
+        _import_module_from_file(entry)
+
+        assert _import_cache_key(entry) == _import_cache_key(str(test_file))
+        assert _import_cache_key(entry) in _IMPORT_CACHE
+
+    def test_import_module_reloads_changed_file(self, tmp_path):
+        """Test that a source-loaded file is executed again after it changes."""
+        test_file = tmp_path / "edited.py"
+        test_file.write_text("from py_clean_cli import CommandArgsModel\nVALUE = 1\n")
+
+        _import_module_from_file(test_file)
+        first_key = _import_cache_key(str(test_file))
+
+        test_file.write_text("from py_clean_cli import CommandArgsModel\nVALUE = 22\n")
+        _import_module_from_file(test_file)
+        second_key = _import_cache_key(str(test_file))
+
+        assert first_key != second_key
+        assert _IMPORT_CACHE[second_key].VALUE == 22
+        assert _IMPORT_CACHE[second_key].__file__ == str(test_file)
+
+    def test_import_module_without_command_marker_is_skipped(self, tmp_path, caplog):
+        """Test that a file mentioning no command is not executed, and not read again."""
+        test_file = tmp_path / "plain_module.py"
+        test_file.write_text("raise RuntimeError('must not run')\n")
+
+        with caplog.at_level("DEBUG"), patch(
+            "py_clean_cli.helpers.discover_commands_helper.import_module"
+        ) as mock_import:
+            _import_module_from_file(test_file)
+
+        mock_import.assert_not_called()
+        assert _IMPORT_CACHE[_import_cache_key(str(test_file))] is None
+        assert any(
+            record.levelname == "DEBUG" and "No command declared" in record.message
+            for record in caplog.records
+        )
+
+        with patch("builtins.open") as mock_open:
+            _import_module_from_file(test_file)
+
+        mock_open.assert_not_called()
+
+    def test_import_module_with_qualified_decorator(self, tmp_path):
+        """Test that `@pkg.command(...)` on a non-CommandArgsModel class passes the prefilter."""
+        test_file = tmp_path / "qualified_module.py"
+        test_file.write_text("""
+from dataclasses import dataclass
+import py_clean_cli as pcc
+from py_clean_cli.models.command_model import CommandArgsAbstract
+
+@pcc.command(name="qualified_cmd", help_text="Qualified command")
+@dataclass
+class QualifiedCommand(CommandArgsAbstract):
+    def exec(self) -> None:
+        pass
+""")
+
+        _import_module_from_file(test_file)
+
+        assert COMMAND_REGISTRY.get_command("qualified_cmd") is not None
+
+    def test_import_module_with_aliased_decorator(self, tmp_path):
+        """Test that an aliased decorator on a user base class passes the prefilter."""
+        (tmp_path / "_base.py").write_text("""
+from dataclasses import dataclass
+from py_clean_cli.models import CommandArgsModel
+
+@dataclass
+class UserBase(CommandArgsModel):
+    pass
+""")
+        test_file = tmp_path / "cmds.py"
+        test_file.write_text("""
+import sys
+from dataclasses import dataclass
+from py_clean_cli import command as cli
+
+sys.path.insert(0, {base_dir!r})
+from _base import UserBase
+
+@cli(name="aliased", help_text="Aliased command")
+@dataclass
+class AliasedCommand(UserBase):
+    def exec(self) -> None:
+        pass
+""".format(base_dir=str(tmp_path)))
+
+        try:
+            _import_module_from_file(test_file)
+        finally:
+            sys.path.remove(str(tmp_path))
+            sys.modules.pop("_base", None)
+
+        assert COMMAND_REGISTRY.get_command("aliased") is not None
+
     def test_import_module_with_syntax_error_logs_warning(self, tmp_path, caplog):
         """Test that importing module with syntax error logs warning."""
         test_file = tmp_path / "syntax_error.py"
         test_file.write_text("""
+from py_clean_cli import CommandArgsModel
+
 def broken_function(
     # Missing closing parenthesis
 """)
@@ -171,10 +370,11 @@ def broken_function(
         assert any("syntax_error" in record.message.lower() for record in caplog.records)
 
     def test_import_module_with_import_error_tries_fallback(self, tmp_path, caplog):
-        """Test that import error triggers fallback spec-based import."""
+        """Test that import error triggers the fallback import from source."""
         test_file = tmp_path / "import_error.py"
         test_file.write_text("""
 import non_existent_module
+from py_clean_cli import CommandArgsModel
 """)
 
         # Should not raise error, but log warning
@@ -215,9 +415,6 @@ class DiscoveredCommand2(CommandArgsModel):
         pass
 """)
 
-        # Clear registry
-        COMMAND_REGISTRY.clear_registry()
-
         # Discover commands
         discover_commands(str(tmp_path))
 
@@ -229,8 +426,6 @@ class DiscoveredCommand2(CommandArgsModel):
 
     def test_discover_commands_empty_directory(self, tmp_path):
         """Test discovering commands in an empty directory."""
-        COMMAND_REGISTRY.clear_registry()
-
         # Should not raise error
         discover_commands(str(tmp_path))
 
@@ -254,8 +449,6 @@ class NestedCommand(CommandArgsModel):
         pass
 """)
 
-        COMMAND_REGISTRY.clear_registry()
-
         discover_commands(str(tmp_path))
 
         # Should find nested command
@@ -288,8 +481,6 @@ class PrivateCommand(CommandArgsModel):
         pass
 """)
 
-        COMMAND_REGISTRY.clear_registry()
-
         discover_commands(str(tmp_path))
 
         # Should only find regular command
@@ -317,8 +508,6 @@ import non_existent_module
 from py_clean_cli import command, CommandArgsModel
 """)
 
-        COMMAND_REGISTRY.clear_registry()
-
         # Should not raise error
         discover_commands(str(tmp_path))
 
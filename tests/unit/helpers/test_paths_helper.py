@@ -0,0 +1,65 @@
+"""
+Tests for paths helper.
+
+This module tests the process-wide project root and the cached
+filesystem checks used to validate package paths.
+"""
+
+from pathlib import Path
+from sys import path as sys_path
+
+import pytest
+
+from py_clean_cli.helpers import PROJECT_ROOT, is_dir, has_init_file
+
+
+@pytest.fixture(autouse=True)
+def clear_path_caches():
+    """Clear the cached filesystem checks before each test."""
+    is_dir.cache_clear()
+    has_init_file.cache_clear()
+
+
+class TestProjectRoot:
+    """Test suite for PROJECT_ROOT constant."""
+
+    def test_project_root_is_in_sys_path(self):
+        """Test that the project root is importable."""
+        assert PROJECT_ROOT in sys_path
+
+    def test_project_root_is_a_directory(self):
+        """Test that the project root points to an existing directory."""
+        assert Path(PROJECT_ROOT).is_dir()
+
+
+class TestIsDir:
+    """Test suite for is_dir function."""
+
+    def test_existing_directory(self, tmp_path):
+        """Test that an existing directory is detected."""
+        assert is_dir(str(tmp_path)) is True
+
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing path is not a directory."""
+        assert is_dir(str(tmp_path / "missing")) is False
+
+    def test_result_is_cached(self, tmp_path):
+        """Test that repeated checks are served from the cache."""
+        is_dir(str(tmp_path))
+        is_dir(str(tmp_path))
+
+        assert is_dir.cache_info().hits == 1
+
+
+class TestHasInitFile:
+    """Test suite for has_init_file function."""
+
+    def test_directory_with_init_file(self, tmp_path):
+        """Test that a package directory is detected."""
+        (tmp_path / "__init__.py").write_text("")
+
+        assert has_init_file(str(tmp_path)) is True
+
+    def test_directory_without_init_file(self, tmp_path):
+        """Test that a plain directory is not a package."""
+        assert has_init_file(str(tmp_path)) is False
@@ -2,7 +2,7 @@
 Tests for CommandArgsModel and CommandArgsAbstract classes.
 
 This module tests the base command model functionality including
-abstract methods, default attributes, and inheritance behavior.
+the exec() contract, default attributes, and inheritance behavior.
 """
 
 from dataclasses import dataclass
@@ -16,17 +16,16 @@ from py_clean_cli.models.command_model import CommandArgsAbstract
 class TestCommandArgsAbstract:
     """Test suite for CommandArgsAbstract base class."""
 
-    def test_is_abstract(self):
-        """Test that CommandArgsAbstract is an abstract base class."""
+    def test_is_not_abc(self):
+        """Test that CommandArgsAbstract does not use the ABC machinery."""
         from abc import ABC
 
-        assert issubclass(CommandArgsAbstract, ABC)
+        assert not issubclass(CommandArgsAbstract, ABC)
 
-    def test_cannot_instantiate_directly(self):
-        """Test that CommandArgsAbstract cannot be instantiated directly."""
-        with pytest.raises(TypeError):
-            # Should raise TypeError because exec() is abstract
-            CommandArgsAbstract()
+    def test_exec_raises_not_implemented(self):
+        """Test that calling exec() on the base class raises NotImplementedError."""
+        with pytest.raises(NotImplementedError):
+            CommandArgsAbstract().exec()
 
     def test_has_default_attributes(self):
         """Test that abstract class defines default attributes."""
@@ -60,14 +59,14 @@ class TestCommandArgsAbstract:
         assert cmd.log_error is True
         assert cmd.log_level == "DEBUG"
 
-    def test_exec_is_abstract(self):
-        """Test that exec() method is abstract."""
+    def test_missing_exec_raises_on_call(self):
+        """Test that a subclass without exec() fails when the command runs."""
         @dataclass
         class IncompleteCommand(CommandArgsAbstract):
             pass  # Missing exec() implementation
 
-        with pytest.raises(TypeError, match="Can't instantiate abstract class"):
-            IncompleteCommand()
+        with pytest.raises(NotImplementedError, match="must implement"):
+            IncompleteCommand().exec()
 
     def test_subclass_must_implement_exec(self):
         """Test that subclass must implement exec() method."""
@@ -118,6 +117,12 @@ class TestCommandArgsModel:
         assert "command_name" not in instance.__dict__
         assert "command_help" not in instance.__dict__
 
+    def test_base_classes_use_slots(self):
+        """Test that the base argument fields are stored in slots, not in an instance dict."""
+        assert CommandArgsAbstract.__slots__ == ("verbose", "log_error", "log_level")
+        assert CommandArgsModel.__slots__ == ()
+        assert not hasattr(CommandArgsModel(), "__dict__")
+
     def test_cannot_instantiate_without_exec_implementation(self):
         """Test that CommandArgsModel cannot be instantiated without exec()."""
         with pytest.raises(NotImplementedError, match="must implement the `exec\\(\\)` method"):
@@ -0,0 +1,121 @@
+"""
+Tests for the git config handling of the gitignore setup script.
+
+This module tests the minimal `.git/config` reader and the in-process
+writer used before falling back to `git config`.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scripts._project_configs import setup_gitignore
+from scripts._project_configs.setup_gitignore import GitignoreSetup, _read_git_config
+
+CONFIG_TEXT = """[core]
+\trepositoryformatversion = 0
+\tbare = false
+[remote "origin"]
+\turl = https://example.com/repo.git
+"""
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """
+    Fixture providing a project root with a plain `.git/config` file.
+
+    Returns:
+        Path: The project root.
+    """
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "config").write_text(CONFIG_TEXT, encoding="utf-8")
+    monkeypatch.setattr(setup_gitignore, "PROJECT_ROOT", str(tmp_path))
+    return tmp_path
+
+
+class TestReadGitConfig:
+    """Test suite for _read_git_config function."""
+
+    def test_reads_plain_entries(self):
+        """Test that section.key names are lower-cased and values kept."""
+        entries = _read_git_config("[Core]\n\tBare = false\n")
+
+        assert entries == {"core.bare": "false"}
+
+    def test_unquotes_and_unescapes_values(self):
+        """Test that quoted values are unquoted and their escapes resolved."""
+        entries = _read_git_config('[core]\n\texcludesFile = "C:\\\\dir\\\\a \\"b\\""\n')
+
+        assert entries["core.excludesfile"] == 'C:\\dir\\a "b"'
+
+    def test_skips_subsections_and_comments(self):
+        """Test that subsection entries and comment lines are ignored."""
+        entries = _read_git_config(CONFIG_TEXT + "# comment\n; other = 1\n")
+
+        assert "remote.url" not in entries
+        assert set(entries) == {"core.repositoryformatversion", "core.bare"}
+
+
+class TestWriteGitConfigFile:
+    """Test suite for GitignoreSetup._write_git_config_file method."""
+
+    def test_appends_new_entry(self, repo):
+        """Test that a missing key is appended, quoted and escaped."""
+        value = 'C:\\dir\\a "b"'
+
+        assert GitignoreSetup()._write_git_config_file((("core.excludesFile", value),))
+
+        text = (repo / ".git" / "config").read_text(encoding="utf-8")
+        assert text.startswith(CONFIG_TEXT)
+        assert _read_git_config(text)["core.excludesfile"] == value
+        assert not (repo / ".git" / "config.lock").exists()
+
+    def test_already_up_to_date(self, repo):
+        """Test that a key already set to the value leaves the file untouched."""
+        config_path = repo / ".git" / "config"
+        config_path.write_text(CONFIG_TEXT + '[core]\n\texcludesFile = "/x/.gitignore"\n', encoding="utf-8")
+        before = config_path.read_text(encoding="utf-8")
+
+        with patch.object(Path, "replace") as mock_replace:
+            assert GitignoreSetup()._write_git_config_file((("core.excludesFile", "/x/.gitignore"),))
+
+        mock_replace.assert_not_called()
+        assert not (repo / ".git" / "config.lock").exists()
+        assert config_path.read_text(encoding="utf-8") == before
+
+    def test_different_value_falls_back_to_git(self, repo):
+        """Test that an existing different value is left to `git config`."""
+        config_path = repo / ".git" / "config"
+        config_path.write_text(CONFIG_TEXT + "[core]\n\texcludesFile = /old\n", encoding="utf-8")
+
+        assert not GitignoreSetup()._write_git_config_file((("core.excludesFile", "/new"),))
+        assert "/new" not in config_path.read_text(encoding="utf-8")
+
+    def test_held_lock_falls_back_to_git(self, repo):
+        """Test that a lock held by someone else is neither used nor removed."""
+        lock_path = repo / ".git" / "config.lock"
+        lock_path.write_text("held", encoding="utf-8")
+
+        assert not GitignoreSetup()._write_git_config_file((("core.excludesFile", "/new"),))
+        assert lock_path.read_text(encoding="utf-8") == "held"
+        assert (repo / ".git" / "config").read_text(encoding="utf-8") == CONFIG_TEXT
+
+    def test_failed_rename_removes_lock(self, repo):
+        """Test that the lock is removed when the config cannot be replaced."""
+        with patch.object(Path, "replace", side_effect=OSError("busy")):
+            assert not GitignoreSetup()._write_git_config_file((("core.excludesFile", "/new"),))
+
+        assert not (repo / ".git" / "config.lock").exists()
+        assert (repo / ".git" / "config").read_text(encoding="utf-8") == CONFIG_TEXT
+
+    def test_update_git_config_runs_git_on_fallback(self, repo):
+        """Test that update_git_config runs `git config` when the file cannot be written."""
+        (repo / ".git" / "config").write_text("[core]\n\texcludesFile = /old\n", encoding="utf-8")
+
+        with patch.object(setup_gitignore, "subprocess_run") as mock_run:
+            GitignoreSetup().update_git_config((("core.excludesFile", "/new"),))
+
+        mock_run.assert_called_once_with(["git", "config", "core.excludesFile", "/new"], check=True)
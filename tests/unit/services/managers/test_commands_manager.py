@@ -5,6 +5,8 @@ This module tests the singleton pattern per parser, command registration,
 argument parsing, and command execution functionality.
 """
 
+import gc
+import weakref
 from dataclasses import dataclass
 from unittest.mock import Mock, patch
 
@@ -25,8 +27,6 @@ def parser():
 @pytest.fixture
 def manager(parser):
     """Fixture providing a CommandsManager instance."""
-    # Clear any existing instances
-    CommandsManager._instances.clear()
     return CommandsManager.get_instance(parser)
 
 
@@ -53,9 +53,6 @@ class TestCommandsManagerSingleton:
         parser1 = ArgumentParser(prog="cli1")
         parser2 = ArgumentParser(prog="cli2")
 
-        # Clear instances for clean test
-        CommandsManager._instances.clear()
-
         manager1a = CommandsManager.get_instance(parser1)
         manager1b = CommandsManager.get_instance(parser1)
         manager2 = CommandsManager.get_instance(parser2)
@@ -70,17 +67,29 @@ class TestCommandsManagerSingleton:
 
     def test_get_instance_creates_manager(self, parser):
         """Test that get_instance creates a new manager."""
-        CommandsManager._instances.clear()
-
         manager = CommandsManager.get_instance(parser)
 
         assert isinstance(manager, CommandsManager)
         assert manager.parser is parser
 
+    def test_manager_stored_on_parser(self, parser):
+        """Test that the manager is attached to its parser."""
+        manager = CommandsManager.get_instance(parser)
+
+        assert parser._commands_manager is manager
+
+    def test_instance_released_with_parser(self):
+        """Test that the manager is collected together with its parser."""
+        parser = ArgumentParser(prog="short_lived")
+        manager_ref = weakref.ref(CommandsManager.get_instance(parser))
+
+        del parser
+        gc.collect()
+
+        assert manager_ref() is None
+
     def test_direct_instantiation_uses_singleton(self, parser):
         """Test that direct instantiation also uses singleton pattern."""
-        CommandsManager._instances.clear()
-
         manager1 = CommandsManager(parser)
         manager2 = CommandsManager(parser)
 
@@ -90,16 +99,30 @@ class TestCommandsManagerSingleton:
 class TestCommandsManagerInitialization:
     """Test suite for CommandsManager initialization."""
 
-    def test_post_init_creates_subparsers(self, manager):
-        """Test that __post_init__ creates subparsers."""
+    def test_init_creates_subparsers(self, manager):
+        """Test that __init__ creates subparsers."""
         assert manager.subparsers is not None
 
+    def test_reinstantiation_keeps_state(self, manager, mock_command_class):
+        """Test that instantiating again for the same parser keeps registered commands."""
+        manager.register_command(mock_command_class)
+        subparsers = manager.subparsers
+
+        again = CommandsManager(manager.parser)
+
+        assert again is manager
+        assert again.subparsers is subparsers
+        assert "mock_cmd" in again.commands
+
+    def test_uses_slots(self, manager):
+        """Test that manager instances carry no per-instance __dict__."""
+        assert not hasattr(manager, "__dict__")
+
     def test_initial_state(self, manager):
         """Test initial state of CommandsManager."""
         assert isinstance(manager.commands, dict)
         assert len(manager.commands) == 0
-        assert isinstance(manager._registered_parsers, set)
-        assert len(manager._registered_parsers) == 0
+        assert len(manager._pending_arguments) == 0
 
 
 class TestCommandsManagerRegistration:
@@ -111,7 +134,7 @@ class TestCommandsManagerRegistration:
 
         assert "mock_cmd" in manager.commands
         assert manager.commands["mock_cmd"] is mock_command_class
-        assert "mock_cmd" in manager._registered_parsers
+        assert "mock_cmd" in manager.subparsers.choices
 
     def test_register_command_returns_self(self, manager, mock_command_class):
         """Test that register_command returns self for chaining."""
@@ -122,13 +145,13 @@ class TestCommandsManagerRegistration:
     def test_register_command_twice_skips_second(self, manager, mock_command_class):
         """Test that registering same command twice skips the second registration."""
         manager.register_command(mock_command_class)
-        initial_count = len(manager._registered_parsers)
+        initial_count = len(manager.commands)
 
         # Register again
         manager.register_command(mock_command_class)
 
         # Should not add duplicate
-        assert len(manager._registered_parsers) == initial_count
+        assert len(manager.commands) == initial_count
 
     def test_register_multiple_commands(self, manager):
         """Test registering multiple different commands."""
@@ -176,6 +199,36 @@ class TestCommandsManagerRegistration:
         assert "reg_cmd1" in manager.commands
         assert "reg_cmd2" in manager.commands
 
+    def test_register_command_defers_arguments(self, manager, mock_command_class):
+        """Test that dataclass arguments are not added at registration time."""
+        manager.register_command(mock_command_class)
+
+        assert "mock_cmd" in manager._pending_arguments
+
+        manager.build_command_arguments("mock_cmd")
+
+        assert "mock_cmd" not in manager._pending_arguments
+
+    def test_register_command_sets_command_dest(self, manager, mock_command_class):
+        """Test that parsed namespaces name the attribute holding the command config."""
+        manager.register_command(mock_command_class)
+        manager.build_command_arguments("mock_cmd")
+
+        namespace = manager.parser.parse_args(["mock_cmd"])
+
+        assert namespace._command_dest == "mock_cmd"
+        assert isinstance(getattr(namespace, namespace._command_dest), mock_command_class)
+
+    def test_register_all_commands_twice_reuses_subparsers(self, manager, mock_command_class):
+        """Test that a second register_all_commands call builds no new subparser."""
+        COMMAND_REGISTRY.register("mock_cmd", "Mock command", mock_command_class)
+        manager.register_all_commands()
+
+        with patch.object(manager.subparsers, "add_parser") as mock_add_parser:
+            manager.register_all_commands()
+
+        mock_add_parser.assert_not_called()
+
     def test_register_all_commands_returns_self(self, manager):
         """Test that register_all_commands returns self for chaining."""
         result = manager.register_all_commands()
@@ -240,6 +293,114 @@ class TestCommandsManagerExecution:
                 # Verify command was parsed (exact assertion depends on implementation)
                 # This is a basic check that no exception was raised
 
+    def test_parse_and_execute_builds_only_selected_command(self, manager):
+        """Test that only the selected command gets its arguments built."""
+        executed = []
+
+        @dataclass
+        class SelectedCommand(CommandArgsModel):
+            command_name = "selected"
+            command_help = "Selected command"
+            value: str = "default"
+
+            def exec(self) -> None:
+                executed.append(self.value)
+
+        @dataclass
+        class OtherCommand(CommandArgsModel):
+            command_name = "other"
+            command_help = "Other command"
+
+            def exec(self) -> None:
+                pass
+
+        manager.register_command(SelectedCommand).register_command(OtherCommand)
+
+        manager.parse_and_execute(["selected", "--value", "custom"])
+
+        assert executed == ["custom"]
+        assert "selected" not in manager._pending_arguments
+        assert "other" in manager._pending_arguments
+
+    def test_parse_and_execute_ignores_command_names_in_option_values(self, manager):
+        """Test that an option value naming another command does not build that command."""
+        executed = []
+
+        @dataclass
+        class HelloCommand(CommandArgsModel):
+            command_name = "hello"
+            command_help = "Hello command"
+            name: str = "World"
+
+            def exec(self) -> None:
+                executed.append(self.name)
+
+        @dataclass
+        class UserCommand(CommandArgsModel):
+            command_name = "user"
+            command_help = "User command"
+
+            def exec(self) -> None:
+                pass
+
+        manager.register_command(HelloCommand).register_command(UserCommand)
+
+        manager.parse_and_execute(["hello", "--name", "user"])
+
+        assert executed == ["user"]
+        assert "user" in manager._pending_arguments
+
+    def test_parse_and_execute_builds_command_after_main_options(self):
+        """Test that the command is built when main parser options precede it."""
+        executed = []
+        parser = ArgumentParser()
+        parser.add_argument("--config", default=None)
+        manager = CommandsManager(parser=parser)
+
+        @dataclass
+        class LateCommand(CommandArgsModel):
+            command_name = "late"
+            command_help = "Late command"
+            value: str = "default"
+
+            def exec(self) -> None:
+                executed.append(self.value)
+
+        manager.register_command(LateCommand)
+
+        manager.parse_and_execute(["--config", "file.toml", "late", "--value", "custom"])
+
+        assert executed == ["custom"]
+        assert "late" not in manager._pending_arguments
+
+    def test_parse_and_execute_parses_with_selected_subparser(self, manager):
+        """Test that a known command is parsed by its subparser, not the main parser."""
+        executed = []
+
+        @dataclass
+        class FastCommand(CommandArgsModel):
+            command_name = "fast"
+            command_help = "Fast command"
+            value: str = "default"
+
+            def exec(self) -> None:
+                executed.append(self.value)
+
+        manager.register_command(FastCommand)
+
+        with patch.object(manager.parser, "parse_args") as mock_parse:
+            manager.parse_and_execute(["fast", "--value", "custom"])
+
+        mock_parse.assert_not_called()
+        assert executed == ["custom"]
+
+    def test_parse_and_execute_unknown_command_exits(self, manager, mock_command_class):
+        """Test that an unknown command is reported by the main parser."""
+        manager.register_command(mock_command_class)
+
+        with pytest.raises(SystemExit):
+            manager.parse_and_execute(["unknown_cmd"])
+
     def test_parse_and_execute_with_error_propagates(self, manager, mock_command_class):
         """Test that execution errors are propagated."""
         @dataclass
@@ -0,0 +1,34 @@
+"""
+Tests for the py_clean_cli package exports.
+
+This module tests that the lazily exported names resolve on first access.
+"""
+
+import pytest
+
+import py_clean_cli
+from py_clean_cli.main import package_cli
+from py_clean_cli.models import CommandArgsModel
+
+
+class TestLazyExports:
+    """Test suite for the PEP 562 lazy exports."""
+
+    def test_lazy_exports_resolve(self):
+        """Test that lazy exports return the objects of their modules."""
+        assert py_clean_cli.CommandArgsModel is CommandArgsModel
+        assert py_clean_cli.package_cli is package_cli
+
+    def test_all_names_are_available(self):
+        """Test that every name in __all__ can be imported."""
+        for name in py_clean_cli.__all__:
+            assert getattr(py_clean_cli, name) is not None
+
+    def test_dir_lists_lazy_exports(self):
+        """Test that dir() lists every name in __all__."""
+        assert set(py_clean_cli.__all__) <= set(dir(py_clean_cli))
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError, match="has no attribute"):
+            py_clean_cli.not_an_export
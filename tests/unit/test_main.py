@@ -0,0 +1,85 @@
+"""
+Tests for package_cli entry point.
+
+This module tests the fast paths of package_cli that run
+before command discovery.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import py_clean_cli
+from py_clean_cli import __version__
+from py_clean_cli.main import package_cli
+
+
+def run_in_fresh_interpreter(code: str) -> subprocess.CompletedProcess:
+    """
+    Run Python code in a new interpreter that can import py_clean_cli.
+
+    Args:
+        code (str): The source code to run.
+
+    Returns:
+        subprocess.CompletedProcess: The finished process, with captured text output.
+    """
+    src_dir = str(Path(py_clean_cli.__file__).parent.parent)
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [src_dir, os.environ.get("PYTHONPATH")]))}
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+
+
+class TestPackageCliImport:
+    """Test suite for the import cost of py_clean_cli.main."""
+
+    def test_import_does_not_load_simple_parsing(self):
+        """Test that importing py_clean_cli.main leaves simple_parsing unloaded."""
+        result = run_in_fresh_interpreter(
+            "import sys, py_clean_cli.main; print('simple_parsing' in sys.modules)"
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "False"
+
+
+class TestPackageCliVersion:
+    """Test suite for the --version short-circuit."""
+
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_version_skips_discovery(self, tmp_path, capsys, flag):
+        """Test that --version prints the version without discovering commands."""
+        with patch("py_clean_cli.main.sys_argv", ["cli", flag]):
+            with patch("py_clean_cli.main.discover_commands") as mock_discover:
+                package_cli(str(tmp_path))
+
+        mock_discover.assert_not_called()
+        assert __version__ in capsys.readouterr().out
+
+        # A fresh interpreter shows whether answering --version loaded simple_parsing
+        result = run_in_fresh_interpreter(
+            "import sys\n"
+            f"sys.argv = ['cli', {flag!r}]\n"
+            "from py_clean_cli.main import package_cli\n"
+            f"package_cli({str(tmp_path)!r})\n"
+            "print('simple_parsing' in sys.modules)\n"
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines() == [f"{tmp_path.name} (py-clean-cli {__version__})", "False"]
+
+    def test_invalid_package_path_raises(self, tmp_path):
+        """Test that a missing package directory raises ValueError."""
+        with patch("py_clean_cli.main.sys_argv", ["cli", "--version"]):
+            with pytest.raises(ValueError, match="not a valid directory"):
+                package_cli(str(tmp_path / "missing"))
+
+    def test_package_path_defaults_to_caller_directory(self, capsys):
+        """Test that the caller's package directory is used when no path is given."""
+        with patch("py_clean_cli.main.sys_argv", ["cli", "--version"]):
+            package_cli()
+
+        assert capsys.readouterr().out.startswith("unit ")